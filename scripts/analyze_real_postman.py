@@ -1,26 +1,38 @@
-import json
 from pathlib import Path
-from statistics import mean
+
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
 
 PATH = Path("data/real/postman_g2_reviews.jsonl")
 
 def main():
-    ratings = []
-    lengths = []
+    # Running aggregates: one pass, no per-review lists kept around.
+    n = 0
+    rating_sum = 0.0
+    rating_min = float("inf")
+    rating_max = float("-inf")
+    length_sum = 0
 
-    with PATH.open("r", encoding="utf-8") as f:
+    with PATH.open("rb") as f:
         for line in f:
-            line = line.strip()
-            if not line:
+            if not line or line.isspace():
                 continue
-            r = json.loads(line)
-            ratings.append(float(r["rating"]))
-            lengths.append(len(r["body"].split()))
+            r = _loads(line)
+            rating = float(r["rating"])
+            n += 1
+            rating_sum += rating
+            if rating < rating_min:
+                rating_min = rating
+            if rating > rating_max:
+                rating_max = rating
+            length_sum += len(r["body"].split())
 
-    print(f"Num reviews: {len(ratings)}")
-    print(f"Avg rating: {mean(ratings):.2f}")
-    print(f"Min rating: {min(ratings)}, Max rating: {max(ratings)}")
-    print(f"Avg review length (words): {mean(lengths):.1f}")
+    print(f"Num reviews: {n}")
+    print(f"Avg rating: {rating_sum / n:.2f}")
+    print(f"Min rating: {rating_min}, Max rating: {rating_max}")
+    print(f"Avg review length (words): {length_sum / n:.1f}")
 
 if __name__ == "__main__":
     main()
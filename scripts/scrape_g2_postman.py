@@ -1,18 +1,54 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass, asdict
+import random
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 from urllib.parse import urlparse
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from selectolax.lexbor import LexborHTMLParser, LexborNode
 import typer
 
+try:
+    from orjson import dumps as _dumps
+except ImportError:
+    def _dumps(obj: dict) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
 app = typer.Typer(help="Scrape G2 Postman review detail pages into JSONL")
 
+# One session shared by all worker threads so keep-alive connections are reused.
+_SESSION = requests.Session()
+_SESSION.headers["User-Agent"] = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/129.0 Safari/537.36"
+)
+_ADAPTER = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.3),
+)
+_SESSION.mount("https://", _ADAPTER)
+_SESSION.mount("http://", _ADAPTER)
+
+# Upper bound for the random delay before each request, to stay clear of 429s.
+_MAX_JITTER_SECONDS = 0.5
+
+# Matches ratings phrased like "4.5 out of 5"
+_RATING_RE = re.compile(r"(?<![\d.])([0-5](?:\.\d)?)\s*out of 5")
+
+# Non-ISO date formats shown on G2 review pages
+_G2_DATE_FORMATS = ("%m/%d/%Y", "%m/%d/%y", "%m-%d-%Y")
+
 
 @dataclass
 class RealReview:
@@ -27,10 +63,16 @@ class RealReview:
     review_date: Optional[str] = None  # ISO string: YYYY-MM-DD
 
 
-def _extract_text(node) -> str:
-    if not node:
+def _extract_text(node: Optional[LexborNode]) -> str:
+    if node is None:
         return ""
-    return " ".join(node.stripped_strings)
+    # Join the non-blank text nodes, each stripped
+    texts = (
+        child.text_content.strip()
+        for child in node.traverse(include_text=True)
+        if child.tag == "-text"
+    )
+    return " ".join(t for t in texts if t)
 
 
 def _guess_review_id(url: str) -> str:
@@ -43,36 +85,30 @@ def _guess_review_id(url: str) -> str:
     return f"g2_{slug}"
 
 
-def _parse_rating(soup: BeautifulSoup) -> Optional[float]:
+def _parse_rating(tree: LexborHTMLParser) -> Optional[float]:
     # Try itemprop="ratingValue"
-    meta = soup.find(attrs={"itemprop": "ratingValue"})
-    if meta:
+    meta = tree.css_first('[itemprop="ratingValue"]')
+    if meta is not None:
         # Can be <meta content="5"> or <span>5</span>
-        val = meta.get("content") or meta.get_text(strip=True)
+        val = meta.attributes.get("content") or meta.text(strip=True)
         try:
             return float(val)
         except (TypeError, ValueError):
             return None
 
-    # Fallback: search for something like "4.5 out of 5"
-    for possible in soup.find_all(string=True):
-        text = possible.strip()
-        if "out of 5" in text:
-            num = text.split("out of 5")[0].strip()
-            try:
-                return float(num)
-            except ValueError:
-                continue
-
-    return None
+    # Fallback: search the page text for something like "4.5 out of 5".
+    # One C-level text() call plus a compiled regex, instead of walking
+    # every text node in Python.
+    m = _RATING_RE.search(tree.root.text(separator="\n"))
+    return float(m.group(1)) if m else None
 
 
-def _parse_review_date(soup: BeautifulSoup) -> Optional[str]:
+def _parse_review_date(tree: LexborHTMLParser) -> Optional[str]:
     # Often wrapped in <time> tag
-    time_tag = soup.find("time")
-    if time_tag and time_tag.get("datetime"):
+    time_tag = tree.css_first("time")
+    if time_tag is not None and time_tag.attributes.get("datetime"):
         # If there's a proper datetime attribute
-        raw = time_tag["datetime"]
+        raw = time_tag.attributes["datetime"]
         try:
             # Try to parse and normalize to YYYY-MM-DD
             dt = datetime.fromisoformat(raw.replace("Z", "+00:00"))
@@ -80,10 +116,10 @@ def _parse_review_date(soup: BeautifulSoup) -> Optional[str]:
         except Exception:
             pass
 
-    if time_tag:
+    if time_tag is not None:
         # Fallback: parse text like "12/4/2025"
-        text = time_tag.get_text(strip=True)
-        for fmt in ("%m/%d/%Y", "%m/%d/%y", "%m-%d-%Y"):
+        text = time_tag.text(strip=True)
+        for fmt in _G2_DATE_FORMATS:
             try:
                 dt = datetime.strptime(text, fmt)
                 return dt.date().isoformat()
@@ -93,38 +129,60 @@ def _parse_review_date(soup: BeautifulSoup) -> Optional[str]:
     return None
 
 
-def _parse_reviewer_role(soup: BeautifulSoup) -> Optional[str]:
-    # Try a few common selectors for job title
-    selectors = [
-        '[itemprop="jobTitle"]',
-        '[data-test="reviewer-job-title"]',
-    ]
-    for sel in selectors:
-        node = soup.select_one(sel)
-        if node:
+# Try a few common selectors for job title
+_ROLE_SELECTORS = (
+    '[itemprop="jobTitle"]',
+    '[data-test="reviewer-job-title"]',
+)
+
+# G2 often uses an h1 or h2 for the review headline. Order matters here,
+# so these stay separate queries rather than one comma-joined selector.
+_TITLE_SELECTORS = (
+    'h1[data-test="review-headline"]',
+    'h2[data-test="review-headline"]',
+    "h1",
+    "h2",
+)
+
+# Many review sites use Q/A blocks. We'll try generic patterns first.
+# These data-test values might need tweaking if G2 changes their DOM.
+_QUESTION_TESTS = frozenset({"review-question", "reviewQuestion"})
+_ANSWER_TESTS = frozenset({"review-answer", "reviewAnswer"})
+
+# One comma-joined selector, so a single DOM walk returns questions and
+# answers together in document order.
+_QA_SELECTOR = ", ".join(
+    f'[data-test="{value}"]' for value in sorted(_QUESTION_TESTS | _ANSWER_TESTS)
+)
+
+# Containers that usually hold the whole review text
+_BODY_SELECTORS = (
+    "article",
+    '[data-test="review-body"]',
+    '[data-test="reviewBody"]',
+)
+
+
+def _parse_reviewer_role(tree: LexborHTMLParser) -> Optional[str]:
+    for sel in _ROLE_SELECTORS:
+        node = tree.css_first(sel)
+        if node is not None:
             text = _extract_text(node)
             if text:
                 return text
     return None
 
 
-def _parse_title(soup: BeautifulSoup) -> Optional[str]:
-    # G2 often uses an h1 or h2 for the review headline
-    candidates = [
-        'h1[data-test="review-headline"]',
-        'h2[data-test="review-headline"]',
-        "h1",
-        "h2",
-    ]
-    for sel in candidates:
-        node = soup.select_one(sel)
+def _parse_title(tree: LexborHTMLParser) -> Optional[str]:
+    for sel in _TITLE_SELECTORS:
+        node = tree.css_first(sel)
         text = _extract_text(node)
         if text:
             return text
     return None
 
 
-def _parse_body(soup: BeautifulSoup) -> Optional[str]:
+def _parse_body(tree: LexborHTMLParser) -> Optional[str]:
     """
     Try to collect Q&A sections like:
       - What do you like best about Postman?
@@ -134,82 +192,53 @@ def _parse_body(soup: BeautifulSoup) -> Optional[str]:
     """
     parts = []
 
-    # Many review sites use Q/A blocks. We'll try generic patterns first.
-    # These selectors might need tweaking if G2 changes their DOM.
-    question_selectors = [
-        '[data-test="review-question"]',
-        '[data-test="reviewQuestion"]',
-    ]
-
-    answer_selectors = [
-        '[data-test="review-answer"]',
-        '[data-test="reviewAnswer"]',
-    ]
-
-    questions = []
-    for sel in question_selectors:
-        questions.extend(soup.select(sel))
-
-    if questions:
-        for q in questions:
-            q_text = _extract_text(q)
-            # Find nearest following answer block
-            ans = None
-            # First: look for a sibling that matches answer selectors
-            sib = q.find_next_sibling()
-            while sib is not None and ans is None:
-                for ans_sel in answer_selectors:
-                    cand = sib.select_one(ans_sel) if hasattr(sib, "select_one") else None
-                    if cand:
-                        ans = cand
-                        break
-                sib = sib.find_next_sibling() if ans is None else None
-
-            a_text = _extract_text(ans) if ans else ""
+    # One walk over questions and answers in document order: each answer
+    # belongs to the question just before it, and a question that is
+    # followed by another question (or nothing) has no answer and is dropped.
+    question = None
+    for node in tree.css(_QA_SELECTOR):
+        if node.attributes.get("data-test") in _QUESTION_TESTS:
+            question = node
+        elif question is not None:
+            q_text = _extract_text(question)
+            a_text = _extract_text(node)
             if q_text and a_text:
                 parts.append(f"{q_text}\n{a_text}")
+            question = None
 
     if parts:
         return "\n\n".join(parts)
 
     # Fallback: try to grab the main article/container text
-    for sel in [
-        "article",
-        '[data-test="review-body"]',
-        '[data-test="reviewBody"]',
-    ]:
-        node = soup.select_one(sel)
-        if node:
+    for sel in _BODY_SELECTORS:
+        node = tree.css_first(sel)
+        if node is not None:
             text = _extract_text(node)
             if text:
                 return text
 
     # Last resort: entire page text (can be noisy)
-    text = _extract_text(soup.body)
+    text = _extract_text(tree.body)
     return text or None
 
 
 def scrape_single_review(url: str, product: str = "Postman") -> RealReview:
     review_id = _guess_review_id(url)
 
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/129.0 Safari/537.36"
-        )
-    }
-
-    resp = requests.get(url, headers=headers, timeout=30)
+    resp = _SESSION.get(url, timeout=30)
     resp.raise_for_status()
 
-    soup = BeautifulSoup(resp.text, "html.parser")
+    # lexbor is a C parser with a native CSS engine; handing it raw bytes
+    # lets it detect the encoding itself.
+    tree = LexborHTMLParser(resp.content)
+    # Script/style contents are not review text
+    tree.strip_tags(["script", "style"])
 
-    title = _parse_title(soup)
-    rating = _parse_rating(soup)
-    body = _parse_body(soup)
-    reviewer_role = _parse_reviewer_role(soup)
-    review_date = _parse_review_date(soup)
+    title = _parse_title(tree)
+    rating = _parse_rating(tree)
+    body = _parse_body(tree)
+    reviewer_role = _parse_reviewer_role(tree)
+    review_date = _parse_review_date(tree)
 
     return RealReview(
         review_id=review_id,
@@ -224,6 +253,20 @@ def scrape_single_review(url: str, product: str = "Postman") -> RealReview:
     )
 
 
+def _scrape_with_jitter(
+    url: str, product: str
+) -> tuple[Optional[RealReview], Optional[Exception]]:
+    """
+    Worker-thread wrapper around scrape_single_review.
+    Returns (review, None) on success or (None, error) so the caller can log it.
+    """
+    time.sleep(random.uniform(0, _MAX_JITTER_SECONDS))
+    try:
+        return scrape_single_review(url, product=product), None
+    except Exception as e:
+        return None, e
+
+
 @app.command()
 def main(
     urls_file: str = typer.Option(
@@ -244,6 +287,12 @@ def main(
         "-p",
         help="Product name to store in the JSON (default: Postman).",
     ),
+    workers: int = typer.Option(
+        8,
+        "--workers",
+        "-w",
+        help="Number of pages to fetch concurrently.",
+    ),
 ):
     """
     Read a list of G2 review URLs and write parsed reviews to JSONL.
@@ -266,20 +315,24 @@ def main(
 
     typer.echo(f"Found {len(urls)} URLs in {urls_path}")
 
-    reviews: list[RealReview] = []
-    for idx, url in enumerate(urls, start=1):
-        typer.echo(f"[{idx}/{len(urls)}] Fetching {url} ...")
-        try:
-            review = scrape_single_review(url, product=product)
-            reviews.append(review)
-        except Exception as e:
-            typer.echo(f"  !! Error scraping {url}: {e}")
-
-    with out_path.open("w", encoding="utf-8") as f:
-        for r in reviews:
-            f.write(json.dumps(asdict(r), ensure_ascii=False) + "\n")
-
-    typer.echo(f"Wrote {len(reviews)} reviews -> {out_path}")
+    n = 0
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor, \
+            out_path.open("wb") as f:
+        results = executor.map(lambda u: _scrape_with_jitter(u, product), urls)
+        for idx, (url, (r, err)) in enumerate(zip(urls, results), start=1):
+            typer.echo(f"[{idx}/{len(urls)}] Fetched {url}")
+            if err is not None:
+                typer.echo(f"  !! Error scraping {url}: {err}")
+                continue
+            # RealReview only has scalar fields, so __dict__ is a cheap stand-in
+            # for asdict(), which deep-copies every value.
+            f.write(_dumps(r.__dict__) + b"\n")
+            # Fetching dominates here, so flush per page to keep partial
+            # output if the run dies midway.
+            f.flush()
+            n += 1
+
+    typer.echo(f"Wrote {n} reviews -> {out_path}")
 
 
 if __name__ == "__main__":
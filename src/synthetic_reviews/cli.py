@@ -1,15 +1,33 @@
 from pathlib import Path
-import json
+from typing import Callable, Dict, List, Tuple
 
 import typer
 
-from .config import load_config
+from .config import Config, load_config
+from .io import save_reviews
 from .generation import (
+    Review,
     generate_many_stub,
     generate_many_openai,
     generate_many_ollama,
 )
 
+# provider -> (banner, generate(cfg, n, model) -> (reviews, elapsed_seconds))
+_PROVIDERS: Dict[str, Tuple[str, Callable[[Config, int, str], Tuple[List[Review], float]]]] = {
+    "stub": (
+        "Using stub generator (no LLM).",
+        lambda cfg, n, model: generate_many_stub(cfg, n),
+    ),
+    "openai": (
+        "Using OpenAI provider with model={model}",
+        lambda cfg, n, model: generate_many_openai(cfg, n, model=model),
+    ),
+    "ollama": (
+        "Using Ollama provider with model={model}",
+        lambda cfg, n, model: generate_many_ollama(cfg, n, model=model),
+    ),
+}
+
 
 def main(
     config: str = typer.Option(
@@ -60,29 +78,20 @@ def main(
         typer.echo(f"Generation time: {elapsed:.2f}s total, {avg_time:.3f}s per review")
         typer.echo(f"Total attempts: {total_attempts}, accepted: {len(reviews)}, rejection rate: {rejection_rate:.1%}")
     else:
-        if provider == "stub":
-            typer.echo("Using stub generator (no LLM).")
-            reviews, elapsed = generate_many_stub(cfg, num_reviews)
-        elif provider == "openai":
-            typer.echo(f"Using OpenAI provider with model={model_name}")
-            reviews, elapsed = generate_many_openai(cfg, num_reviews, model=model_name)
-        elif provider == "ollama":
-            typer.echo(f"Using Ollama provider with model={model_name}")
-            reviews, elapsed = generate_many_ollama(cfg, num_reviews, model=model_name)
-        else:
+        entry = _PROVIDERS.get(provider)
+        if entry is None:
             typer.echo(f"Unknown provider '{provider}'. Use 'stub', 'openai', or 'ollama'.")
             raise typer.Exit(code=1)
+        banner, generate = entry
+        typer.echo(banner.format(model=model_name))
+        reviews, elapsed = generate(cfg, num_reviews, model_name)
         
         # Report timing
         avg_time = elapsed / len(reviews) if reviews else 0.0
         typer.echo(f"Generation time: {elapsed:.2f}s total, {avg_time:.3f}s per review")
 
     out_path = Path(output)
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-
-    with out_path.open("w", encoding="utf-8") as f:
-        for r in reviews:
-            f.write(json.dumps(r.model_dump(mode="json"), ensure_ascii=False) + "\n")
+    save_reviews(out_path, reviews)
 
     typer.echo(f"Generated {len(reviews)} reviews -> {out_path}")
 
@@ -50,6 +50,8 @@ def main(
     for pair in expected_dist.split(","):
         rating_str, prob_str = pair.split(":")
         expected_rating_dist[int(rating_str)] = float(prob_str)
+    # Same distribution indexed by rating (0 unused) for the report tables
+    expected_by_rating = [expected_rating_dist.get(r, 0.0) for r in range(6)]
     
     # Load datasets
     datasets: Dict[str, tuple[Path, List]] = {}
@@ -77,7 +79,7 @@ def main(
         summaries[label] = annotate_quality(reviews, expected_rating_dist=expected_rating_dist)
     
     # Generate report
-    md_lines = _build_comparison_report(datasets, summaries, expected_rating_dist)
+    md_lines = _build_comparison_report(datasets, summaries, expected_by_rating)
     
     # Write output
     output_path = Path(output)
@@ -90,7 +92,7 @@ def main(
 def _build_comparison_report(
     datasets: Dict[str, tuple[Path, List]],
     summaries: Dict[str, QualitySummary],
-    expected_dist: Dict[int, float],
+    expected_by_rating: List[float],
 ) -> List[str]:
     """Build the markdown comparison report."""
     lines = []
@@ -113,7 +115,7 @@ def _build_comparison_report(
     lines.append("| Rating | Expected % |")
     lines.append("|--------|-----------|")
     for rating in [5, 4, 3, 2, 1]:
-        pct = expected_dist.get(rating, 0.0) * 100
+        pct = expected_by_rating[rating] * 100
         lines.append(f"| {rating}★ | {pct:.1f}% |")
     lines.append("")
     
@@ -135,11 +137,10 @@ def _build_comparison_report(
         ("Avg Sentiment", lambda s: f"{s.avg_sentiment_score:.3f}"),
     ]
     
-    for metric_name, extractor in metrics:
-        row = f"| {metric_name} | "
-        row += " | ".join(extractor(summaries[label]) for label in summaries.keys())
-        row += " |"
-        lines.append(row)
+    lines.extend(
+        "| " + " | ".join([metric_name] + [extractor(s) for s in summaries.values()]) + " |"
+        for metric_name, extractor in metrics
+    )
     
     lines.append("")
     
@@ -149,16 +150,15 @@ def _build_comparison_report(
     lines.append("| Rating | " + " | ".join(summaries.keys()) + " |")
     lines.append("|--------|" + "|".join(["--------"] * len(summaries)) + "|")
     
+    # Histogram totals don't depend on the rating, so compute them once per dataset
+    hists = [(s.rating_histogram, sum(s.rating_histogram.values())) for s in summaries.values()]
     for rating in [5, 4, 3, 2, 1]:
-        row = f"| {rating}★ | "
-        counts = []
-        for label in summaries.keys():
-            count = summaries[label].rating_histogram.get(rating, 0)
-            total = sum(summaries[label].rating_histogram.values())
+        cells = [f"{rating}★"]
+        for hist, total in hists:
+            count = hist.get(rating, 0)
             pct = (count / total * 100) if total > 0 else 0.0
-            counts.append(f"{count} ({pct:.1f}%)")
-        row += " | ".join(counts) + " |"
-        lines.append(row)
+            cells.append(f"{count} ({pct:.1f}%)")
+        lines.append("| " + " | ".join(cells) + " |")
     
     lines.append("")
     
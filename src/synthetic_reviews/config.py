@@ -1,9 +1,13 @@
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List
 
 import yaml
 from pydantic import BaseModel
 
+# libyaml's C loader when PyYAML was built with it, else the pure-Python one
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class Persona(BaseModel):
     id: str
@@ -19,7 +23,19 @@ class Config(BaseModel):
     rating_distribution: Dict[int, float]
 
 
-def load_config(path: Path) -> Config:
-    with path.open("r", encoding="utf-8") as f:
-        raw = yaml.safe_load(f)
+@lru_cache(maxsize=8)
+def _load(path_str: str, mtime: float) -> Config:
+    # mtime is only part of the cache key, so editing the file invalidates it
+    with open(path_str, "r", encoding="utf-8") as f:
+        raw = yaml.load(f, Loader=_YAML_LOADER)
     return Config(**raw)
+
+
+def load_config(path: Path) -> Config:
+    """
+    Load and validate a YAML config. Repeat loads of an unchanged file
+    reuse the cached parse.
+    """
+    path = Path(path).resolve()
+    # The cached Config is shared, so hand out a copy callers can mutate
+    return _load(str(path), path.stat().st_mtime).model_copy(deep=True)
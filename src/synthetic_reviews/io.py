@@ -1,26 +1,74 @@
 from __future__ import annotations
 
-import json
 from pathlib import Path
-from typing import List
+from typing import Iterator, List
+
+from pydantic import TypeAdapter, ValidationError
 
 from .generation import Review
 
+# Built once: validates a whole JSON array of reviews inside pydantic-core.
+_REVIEW_LIST_ADAPTER = TypeAdapter(List[Review])
+# Serializes a single review straight to JSON bytes, without a dict in between.
+_REVIEW_ADAPTER = TypeAdapter(Review)
+
+# save_reviews joins encoded lines into one bytes object and issues a
+# single write() per this many bytes (so one write for typical files).
+_WRITE_CHUNK_BYTES = 4 * 1024 * 1024
+
+# Files below this size are read with a single read() call; larger ones
+# are streamed line by line so memory stays bounded.
+_BULK_READ_LIMIT = 500 * 1024 * 1024
+
+
+def _iter_lines(path: Path, stream: bool = False) -> Iterator[bytes]:
+    with path.open("rb") as f:
+        if not stream and path.stat().st_size < _BULK_READ_LIMIT:
+            yield from f.read().splitlines()
+        else:
+            for line in f:
+                yield line.rstrip(b"\r\n")
+
+
+def _validate_line(path: Path, lineno: int, line: bytes) -> Review:
+    try:
+        return Review.model_validate_json(line)
+    except ValidationError as e:
+        raise ValueError(f"{path}:{lineno}: invalid review record\n{e}") from e
+
+
+def iter_reviews(path: str | Path) -> Iterator[Review]:
+    """
+    Stream reviews from a JSONL file one at a time, so memory does not
+    grow with the file size.
+    """
+    p = Path(path)
+    for lineno, line in enumerate(_iter_lines(p, stream=True), start=1):
+        if line and not line.isspace():
+            yield _validate_line(p, lineno, line)
+
 
 def load_reviews(path: str | Path) -> List[Review]:
     """
     Load reviews from a JSONL file into a list[Review].
     """
     p = Path(path)
-    reviews: List[Review] = []
-    with p.open("r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            data = json.loads(line)
-            reviews.append(Review.model_validate(data))
-    return reviews
+    numbered: List[tuple[int, bytes]] = []
+    for lineno, line in enumerate(_iter_lines(p), start=1):
+        if line and not line.isspace():
+            numbered.append((lineno, line))
+
+    # Fast path: validate every record in one call by wrapping the lines
+    # in a JSON array. Only if that fails (or a line held more than one
+    # value) re-validate line by line to report where the problem is.
+    buf = b"[" + b",".join(line for _, line in numbered) + b"]"
+    try:
+        reviews = _REVIEW_LIST_ADAPTER.validate_json(buf)
+        if len(reviews) == len(numbered):
+            return reviews
+    except ValidationError:
+        pass
+    return [_validate_line(p, lineno, line) for lineno, line in numbered]
 
 
 def save_reviews(path: str | Path, reviews: List[Review]) -> None:
@@ -29,6 +77,15 @@ def save_reviews(path: str | Path, reviews: List[Review]) -> None:
     """
     p = Path(path)
     p.parent.mkdir(parents=True, exist_ok=True)
-    with p.open("w", encoding="utf-8") as f:
+    with p.open("wb") as f:
+        chunk: List[bytes] = []
+        size = 0
         for r in reviews:
-            f.write(json.dumps(r.model_dump(mode="json"), ensure_ascii=False) + "\n")
+            line = _REVIEW_ADAPTER.dump_json(r) + b"\n"
+            chunk.append(line)
+            size += len(line)
+            if size >= _WRITE_CHUNK_BYTES:
+                f.write(b"".join(chunk))
+                chunk.clear()
+                size = 0
+        f.write(b"".join(chunk))
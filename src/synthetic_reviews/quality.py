@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import math
 import re
+from bisect import bisect_left, insort
 from collections import Counter
+from itertools import chain
 from dataclasses import dataclass
 from typing import Iterable, List, Dict, Set
 
@@ -11,19 +13,215 @@ from .generation import Review
 
 WORD_RE = re.compile(r"\w+")
 
+_DEFAULT_DOMAIN_KEYWORDS = frozenset({
+    "api",
+    "endpoint",
+    "request",
+    "response",
+    "debug",
+    "debugging",
+    "auth",
+    "token",
+    "rest",
+    "http",
+    "headers",
+    "payload",
+    "json",
+    "postman",
+    "insomnia",
+    "hoppscotch",
+    "ci",
+    "pipeline",
+    "test",
+    "testing",
+})
+
+# Sentiment lexicon for _compute_sentiment_score
+_POSITIVE_WORDS = frozenset({
+    "great", "excellent", "good", "love", "best", "perfect", "amazing",
+    "easy", "helpful", "fast", "reliable", "powerful", "smooth", "efficient"
+})
+_NEGATIVE_WORDS = frozenset({
+    "bad", "poor", "worst", "hate", "terrible", "awful", "slow",
+    "bug", "crash", "fail", "broken", "unusable", "frustrating", "confusing"
+})
+
+# rating_text_mismatch triggers: complaints in a high rating, hype in a low one
+_MISMATCH_NEGATIVE_WORDS = frozenset({"bug", "crash", "fail", "broken", "unusable"})
+_MISMATCH_HYPE_WORDS = frozenset({"perfect", "flawless", "amazing", "incredible"})
+
+# ASCII fast path for tokenize: one bytes.translate pass lowercases A-Z and
+# turns every non-word byte into a space, so split() yields exactly the
+# tokens WORD_RE would.
+_ASCII_TOKEN_TABLE = bytes(
+    c + 32 if 65 <= c <= 90
+    else c if c < 128 and (chr(c).isalnum() or c == 95)
+    else 32
+    for c in range(256)
+)
+
 
 def tokenize(text: str) -> List[str]:
-    return [w.lower() for w in WORD_RE.findall(text)]
+    if text.isascii():
+        return text.encode("ascii").translate(_ASCII_TOKEN_TABLE).decode("ascii").split()
+    # Lowercase the whole text once so findall's list is the result,
+    # rather than building a second list of per-token lower() copies.
+    return WORD_RE.findall(text.lower())
 
 
 def jaccard(a: Set[str], b: Set[str]) -> float:
-    if not a and not b:
-        return 0.0
+    # |a ∪ b| = |a| + |b| - |a ∩ b|, so one set intersection is enough
     inter = len(a & b)
-    union = len(a | b)
+    union = len(a) + len(b) - inter
     return inter / union if union else 0.0
 
 
+# A token's review-id list (8 bytes per id) is swapped for a bitmask (1 bit
+# per review) once it appears in at least 1 of every this many reviews.
+_MASK_MIN_DENSITY = 64
+
+
+def _ids_to_mask(ids: Iterable[int], nbytes: int) -> int:
+    buf = bytearray(nbytes)
+    for i in ids:
+        buf[i >> 3] |= 1 << (i & 7)
+    return int.from_bytes(buf, "little")
+
+
+class _NoveltyIndex:
+    """
+    Exact max-Jaccard lookup against every token set added so far.
+
+    Review ids are bit positions in Python ints: each frequent token maps to a
+    bitmask of the earlier reviews containing it, and each set size to a
+    bitmask of the reviews with that many unique tokens. A query adds up the
+    bitmasks of its tokens as bit-sliced counters (plane k holds bit k of
+    every review's intersection count), so all pairwise intersections are
+    counted by a few big-int operations per token instead of a Python step
+    per pair.
+
+    A bitmask costs N/8 bytes however rare its token is, so tokens start
+    with a plain list of review ids and switch to a bitmask only once the
+    list would be as large (df >= N/64). Memory then grows with the number
+    of tokens indexed instead of vocabulary x reviews.
+    """
+
+    def __init__(self) -> None:
+        self._masks: Dict[str, int] = {}
+        self._ids: Dict[str, List[int]] = {}
+        self._by_size: Dict[int, int] = {}
+        self._sizes: List[int] = []
+        self._count = 0
+
+    @staticmethod
+    def _accumulate(planes: List[int], carry: int, k: int = 0) -> None:
+        # Ripple-carry add of `carry` times 2**k into the counters
+        while carry:
+            if k >= len(planes):
+                planes.extend([0] * (k - len(planes)))
+                planes.append(carry)
+                return
+            plane = planes[k]
+            planes[k] = plane ^ carry
+            carry &= plane
+            k += 1
+
+    def max_jaccard(self, token_set: Set[str]) -> float:
+        planes: List[int] = []
+        rare: List[List[int]] = []
+        for token in token_set:
+            mask = self._masks.get(token)
+            if mask is not None:
+                self._accumulate(planes, mask)
+            else:
+                ids = self._ids.get(token)
+                if ids is not None:
+                    rare.append(ids)
+
+        if rare:
+            # Count the rare tokens' ids, then add each group of reviews
+            # sharing a count as one bitmask (count * mask, bit by bit)
+            by_count: Dict[int, List[int]] = {}
+            for rid, c in Counter(chain.from_iterable(rare)).items():
+                by_count.setdefault(c, []).append(rid)
+            nbytes = (self._count + 7) >> 3
+            for c, rids in by_count.items():
+                mask = _ids_to_mask(rids, nbytes)
+                k = 0
+                while c:
+                    if c & 1:
+                        self._accumulate(planes, mask, k)
+                    c >>= 1
+                    k += 1
+
+        hits = 0
+        for plane in planes:
+            hits |= plane
+        if not hits:
+            return 0.0
+
+        # For a fixed candidate size Jaccard grows with the intersection, so
+        # the best candidate of each size is the one with the highest count.
+        # A candidate of size c can reach at most min(s, c) / max(s, c), so
+        # sizes are visited from the closest outwards and the walk stops once
+        # neither side can beat the best score found.
+        size = len(token_set)
+        sizes = self._sizes
+        hi = bisect_left(sizes, size)
+        lo = hi - 1
+        max_j = 0.0
+        while True:
+            lo_bound = sizes[lo] / size if lo >= 0 else 0.0
+            hi_bound = size / sizes[hi] if hi < len(sizes) else 0.0
+            if lo_bound >= hi_bound:
+                if lo_bound <= max_j:
+                    break
+                cand_size = sizes[lo]
+                lo -= 1
+            else:
+                if hi_bound <= max_j:
+                    break
+                cand_size = sizes[hi]
+                hi += 1
+            cand = self._by_size[cand_size] & hits
+            if not cand:
+                continue
+            inter = 0
+            for k in range(len(planes) - 1, -1, -1):
+                top = cand & planes[k]
+                if top:
+                    cand = top
+                    inter |= 1 << k
+            j = inter / (size + cand_size - inter)
+            if j > max_j:
+                max_j = j
+        return max_j
+
+    def add(self, token_set: Set[str]) -> None:
+        rid = self._count
+        bit = 1 << rid
+        self._count += 1
+        masks = self._masks
+        all_ids = self._ids
+        for token in token_set:
+            mask = masks.get(token)
+            if mask is not None:
+                masks[token] = mask | bit
+                continue
+            ids = all_ids.get(token)
+            if ids is None:
+                all_ids[token] = [rid]
+            else:
+                ids.append(rid)
+                if len(ids) * _MASK_MIN_DENSITY >= self._count:
+                    masks[token] = _ids_to_mask(ids, (rid >> 3) + 1)
+                    del all_ids[token]
+        size = len(token_set)
+        if size not in self._by_size:
+            insort(self._sizes, size)
+        self._by_size[size] = self._by_size.get(size, 0) | bit
+
+
 @dataclass
 class QualitySummary:
     avg_vocab_diversity: float
@@ -43,71 +241,42 @@ def _compute_sentiment_score(token_set: Set[str]) -> float:
     Simple sentiment heuristic: (#positive - #negative) / total
     Returns a value roughly in [-1, 1].
     """
-    positive_words = {
-        "great", "excellent", "good", "love", "best", "perfect", "amazing",
-        "easy", "helpful", "fast", "reliable", "powerful", "smooth", "efficient"
-    }
-    negative_words = {
-        "bad", "poor", "worst", "hate", "terrible", "awful", "slow",
-        "bug", "crash", "fail", "broken", "unusable", "frustrating", "confusing"
-    }
-    pos_count = len(token_set & positive_words)
-    neg_count = len(token_set & negative_words)
+    pos_count = len(token_set & _POSITIVE_WORDS)
+    neg_count = len(token_set & _NEGATIVE_WORDS)
     total = len(token_set)
     return (pos_count - neg_count) / total if total > 0 else 0.0
 
 
 def annotate_quality(
-    reviews: List[Review],
+    reviews: Iterable[Review],
     domain_keywords: Iterable[str] | None = None,
     expected_rating_dist: Dict[int, float] | None = None,
 ) -> QualitySummary:
     if domain_keywords is None:
-        domain_keywords = {
-            "api",
-            "endpoint",
-            "request",
-            "response",
-            "debug",
-            "debugging",
-            "auth",
-            "token",
-            "rest",
-            "http",
-            "headers",
-            "payload",
-            "json",
-            "postman",
-            "insomnia",
-            "hoppscotch",
-            "ci",
-            "pipeline",
-            "test",
-            "testing",
-        }
+        domain_keywords = _DEFAULT_DOMAIN_KEYWORDS
     else:
-        domain_keywords = {k.lower() for k in domain_keywords}
+        domain_keywords = frozenset(k.lower() for k in domain_keywords)
 
-    seen_token_sets: List[Set[str]] = []
-    vocab_divs: List[float] = []
-    novelties: List[float] = []
-    realism_scores: List[float] = []
-    sentiment_scores: List[float] = []
+    # Reviews are consumed in a single pass with running totals, so
+    # `reviews` can be a generator streaming straight from disk.
+    novelty_index = _NoveltyIndex()
+    count = 0
+    vocab_div_sum = 0.0
+    novelty_sum = 0.0
+    realism_sum = 0.0
+    sentiment_sum = 0.0
     rejections = 0
-    rating_hist: Dict[int, int] = {}
+    rating_hist: Counter = Counter()
 
     for r in reviews:
         tokens = tokenize(r.body)
-        token_set = set(tokens)
+        token_set = frozenset(tokens)
         total_tokens = len(tokens)
         unique_tokens = len(token_set)
 
         vocab_div = (unique_tokens / total_tokens) if total_tokens > 0 else 0.0
 
-        if seen_token_sets:
-            max_j = max(jaccard(token_set, prev) for prev in seen_token_sets)
-        else:
-            max_j = 0.0
+        max_j = novelty_index.max_jaccard(token_set)
         novelty = 1.0 - max_j
 
         if domain_keywords:
@@ -127,12 +296,10 @@ def annotate_quality(
         if realism < 0.05:
             flags.append("low_domain_realism")
 
-        negative_words = {"bug", "crash", "fail", "broken", "unusable"}
-        if r.rating >= 4 and (token_set & negative_words):
+        if r.rating >= 4 and not token_set.isdisjoint(_MISMATCH_NEGATIVE_WORDS):
             flags.append("rating_text_mismatch")
 
-        positive_hype = {"perfect", "flawless", "amazing", "incredible"}
-        if r.rating <= 2 and (token_set & positive_hype):
+        if r.rating <= 2 and not token_set.isdisjoint(_MISMATCH_HYPE_WORDS):
             flags.append("rating_text_mismatch")
 
         is_accepted = len(flags) == 0
@@ -145,45 +312,46 @@ def annotate_quality(
 
         # Compute sentiment
         sentiment = _compute_sentiment_score(token_set)
-        sentiment_scores.append(sentiment)
+        sentiment_sum += sentiment
         
-        seen_token_sets.append(token_set)
-        vocab_divs.append(vocab_div)
-        novelties.append(novelty)
-        realism_scores.append(realism)
+        novelty_index.add(token_set)
+        count += 1
+        vocab_div_sum += vocab_div
+        novelty_sum += novelty
+        realism_sum += realism
         if not is_accepted:
             rejections += 1
 
-        rating_hist[r.rating] = rating_hist.get(r.rating, 0) + 1
+        rating_hist[r.rating] += 1
 
-    n = len(reviews) or 1
+    n = count or 1
     
-    # Compute bias/skew metrics
-    high_rating_count = sum(1 for r in reviews if r.rating >= 4)
-    low_rating_count = sum(1 for r in reviews if r.rating <= 2)
+    # Compute bias/skew metrics from the histogram (one entry per distinct
+    # rating) rather than re-scanning every review
+    high_rating_count = sum(c for rating, c in rating_hist.items() if rating >= 4)
+    low_rating_count = sum(c for rating, c in rating_hist.items() if rating <= 2)
     high_rating_ratio = high_rating_count / n
     low_rating_ratio = low_rating_count / n
     
     # Compute rating skew score (simplified KL divergence if expected dist provided)
     rating_skew = 0.0
     if expected_rating_dist:
-        # Normalize actual histogram
-        actual_dist = {k: v / n for k, v in rating_hist.items()}
-        # Simple squared difference as skew metric
-        for rating in [1, 2, 3, 4, 5]:
-            expected = expected_rating_dist.get(rating, 0.0)
-            actual = actual_dist.get(rating, 0.0)
-            rating_skew += (actual - expected) ** 2
+        # Simple squared difference between the normalized histogram and the
+        # expected distribution (missing ratings count as 0 in the Counter)
+        rating_skew = sum(
+            (rating_hist[rating] / n - expected_rating_dist.get(rating, 0.0)) ** 2
+            for rating in range(1, 6)
+        )
     
     summary = QualitySummary(
-        avg_vocab_diversity=sum(vocab_divs) / n if vocab_divs else 0.0,
-        avg_semantic_novelty=sum(novelties) / n if novelties else 0.0,
-        avg_domain_realism=sum(realism_scores) / n if realism_scores else 0.0,
+        avg_vocab_diversity=vocab_div_sum / n,
+        avg_semantic_novelty=novelty_sum / n,
+        avg_domain_realism=realism_sum / n,
         rejection_rate=rejections / n,
-        rating_histogram=rating_hist,
+        rating_histogram=dict(rating_hist),
         high_rating_ratio=high_rating_ratio,
         low_rating_ratio=low_rating_ratio,
         rating_skew_score=rating_skew,
-        avg_sentiment_score=sum(sentiment_scores) / n if sentiment_scores else 0.0,
+        avg_sentiment_score=sentiment_sum / n,
     )
     return summary
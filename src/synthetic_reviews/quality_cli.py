@@ -3,10 +3,48 @@ import json
 
 import typer
 
-from .io import load_reviews
+from .io import iter_reviews
 from .quality import annotate_quality, QualitySummary
 
 
+_SUMMARY_TEMPLATE = """\
+## {title} Summary
+
+### Diversity Metrics
+- Average vocab diversity: `{s.avg_vocab_diversity:.3f}`
+- Average semantic novelty: `{s.avg_semantic_novelty:.3f}`
+- Average domain realism: `{s.avg_domain_realism:.3f}`
+
+### Quality & Bias Metrics
+- Rejection rate: `{s.rejection_rate:.3f}`
+- High rating ratio (≥4★): `{s.high_rating_ratio:.3f}`
+- Low rating ratio (≤2★): `{s.low_rating_ratio:.3f}`
+- Rating skew score: `{s.rating_skew_score:.4f}`
+- Average sentiment score: `{s.avg_sentiment_score:.3f}`
+- Rating histogram: `{histogram}`
+"""
+
+_SIDE_BY_SIDE_TEMPLATE = """\
+## Synthetic vs Real (Side-by-side)
+
+| Metric | Synthetic | Real |
+|--------|-----------|------|
+| Average vocab diversity | `{syn.avg_vocab_diversity:.3f}` | `{real.avg_vocab_diversity:.3f}` |
+| Average semantic novelty | `{syn.avg_semantic_novelty:.3f}` | `{real.avg_semantic_novelty:.3f}` |
+| Average domain realism | `{syn.avg_domain_realism:.3f}` | `{real.avg_domain_realism:.3f}` |
+| Rejection rate | `{syn.rejection_rate:.3f}` | `{real.rejection_rate:.3f}` |
+| High rating ratio (≥4★) | `{syn.high_rating_ratio:.3f}` | `{real.high_rating_ratio:.3f}` |
+| Low rating ratio (≤2★) | `{syn.low_rating_ratio:.3f}` | `{real.low_rating_ratio:.3f}` |
+| Avg sentiment score | `{syn.avg_sentiment_score:.3f}` | `{real.avg_sentiment_score:.3f}` |
+"""
+
+
+def _render_summary(title: str, summary: QualitySummary) -> str:
+    return _SUMMARY_TEMPLATE.format(
+        title=title, s=summary, histogram=json.dumps(summary.rating_histogram)
+    )
+
+
 def main(
     synthetic: str = typer.Option(
         ...,
@@ -33,8 +71,7 @@ def main(
         typer.echo(f"Synthetic file not found: {syn_path}")
         raise typer.Exit(code=1)
 
-    syn_reviews = load_reviews(syn_path)
-    syn_summary = annotate_quality(syn_reviews)
+    syn_summary = annotate_quality(iter_reviews(syn_path))
 
     real_summary = None
     real_path = None
@@ -43,94 +80,22 @@ def main(
         if not real_path.exists():
             typer.echo(f"Real file not found: {real_path}")
             raise typer.Exit(code=1)
-        real_reviews = load_reviews(real_path)
-        real_summary = annotate_quality(real_reviews)
+        real_summary = annotate_quality(iter_reviews(real_path))
 
-    md_lines: list[str] = []
-
-    md_lines.append(f"# Quality Report – {label}")
-    md_lines.append("")
-    md_lines.append("## Inputs")
-    md_lines.append("")
-    md_lines.append(f"- Synthetic file: `{syn_path}`")
+    inputs = f"- Synthetic file: `{syn_path}`\n"
     if real_path:
-        md_lines.append(f"- Real file: `{real_path}`")
-    md_lines.append("")
-
-    # synthetic summary
-    md_lines.append("## Synthetic Summary")
-    md_lines.append("")
-    md_lines.append("### Diversity Metrics")
-    md_lines.append(f"- Average vocab diversity: `{syn_summary.avg_vocab_diversity:.3f}`")
-    md_lines.append(f"- Average semantic novelty: `{syn_summary.avg_semantic_novelty:.3f}`")
-    md_lines.append(f"- Average domain realism: `{syn_summary.avg_domain_realism:.3f}`")
-    md_lines.append("")
-    md_lines.append("### Quality & Bias Metrics")
-    md_lines.append(f"- Rejection rate: `{syn_summary.rejection_rate:.3f}`")
-    md_lines.append(f"- High rating ratio (≥4★): `{syn_summary.high_rating_ratio:.3f}`")
-    md_lines.append(f"- Low rating ratio (≤2★): `{syn_summary.low_rating_ratio:.3f}`")
-    md_lines.append(f"- Rating skew score: `{syn_summary.rating_skew_score:.4f}`")
-    md_lines.append(f"- Average sentiment score: `{syn_summary.avg_sentiment_score:.3f}`")
-    md_lines.append(f"- Rating histogram: `{json.dumps(syn_summary.rating_histogram)}`")
-    md_lines.append("")
-
+        inputs += f"- Real file: `{real_path}`\n"
+    sections = [
+        f"# Quality Report – {label}\n\n## Inputs\n\n{inputs}",
+        _render_summary("Synthetic", syn_summary),
+    ]
     if real_summary is not None:
-        md_lines.append("## Real Summary")
-        md_lines.append("")
-        md_lines.append("### Diversity Metrics")
-        md_lines.append(f"- Average vocab diversity: `{real_summary.avg_vocab_diversity:.3f}`")
-        md_lines.append(f"- Average semantic novelty: `{real_summary.avg_semantic_novelty:.3f}`")
-        md_lines.append(f"- Average domain realism: `{real_summary.avg_domain_realism:.3f}`")
-        md_lines.append("")
-        md_lines.append("### Quality & Bias Metrics")
-        md_lines.append(f"- Rejection rate: `{real_summary.rejection_rate:.3f}`")
-        md_lines.append(f"- High rating ratio (≥4★): `{real_summary.high_rating_ratio:.3f}`")
-        md_lines.append(f"- Low rating ratio (≤2★): `{real_summary.low_rating_ratio:.3f}`")
-        md_lines.append(f"- Rating skew score: `{real_summary.rating_skew_score:.4f}`")
-        md_lines.append(f"- Average sentiment score: `{real_summary.avg_sentiment_score:.3f}`")
-        md_lines.append(f"- Rating histogram: `{json.dumps(real_summary.rating_histogram)}`")
-        md_lines.append("")
-
-        md_lines.append("## Synthetic vs Real (Side-by-side)")
-        md_lines.append("")
-        md_lines.append("| Metric | Synthetic | Real |")
-        md_lines.append("|--------|-----------|------|")
-        md_lines.append(
-            f"| Average vocab diversity | "
-            f"`{syn_summary.avg_vocab_diversity:.3f}` | "
-            f"`{real_summary.avg_vocab_diversity:.3f}` |"
-        )
-        md_lines.append(
-            f"| Average semantic novelty | "
-            f"`{syn_summary.avg_semantic_novelty:.3f}` | "
-            f"`{real_summary.avg_semantic_novelty:.3f}` |"
-        )
-        md_lines.append(
-            f"| Average domain realism | "
-            f"`{syn_summary.avg_domain_realism:.3f}` | "
-            f"`{real_summary.avg_domain_realism:.3f}` |"
-        )
-        md_lines.append(
-            f"| Rejection rate | `{syn_summary.rejection_rate:.3f}` | "
-            f"`{real_summary.rejection_rate:.3f}` |"
-        )
-        md_lines.append(
-            f"| High rating ratio (≥4★) | `{syn_summary.high_rating_ratio:.3f}` | "
-            f"`{real_summary.high_rating_ratio:.3f}` |"
-        )
-        md_lines.append(
-            f"| Low rating ratio (≤2★) | `{syn_summary.low_rating_ratio:.3f}` | "
-            f"`{real_summary.low_rating_ratio:.3f}` |"
-        )
-        md_lines.append(
-            f"| Avg sentiment score | `{syn_summary.avg_sentiment_score:.3f}` | "
-            f"`{real_summary.avg_sentiment_score:.3f}` |"
-        )
-        md_lines.append("")
+        sections.append(_render_summary("Real", real_summary))
+        sections.append(_SIDE_BY_SIDE_TEMPLATE.format(syn=syn_summary, real=real_summary))
 
     out_path = Path(output)
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_text("\n".join(md_lines), encoding="utf-8")
+    out_path.write_text("\n".join(sections), encoding="utf-8")
 
     typer.echo(f"Quality report written -> {out_path}")
 